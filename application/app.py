@@ -12,14 +12,26 @@ It includes the following endpoints:
 
 # pylint: disable=E0401, E0611
 
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from decimal import Decimal
+from functools import partial
 from typing import Union
-from fastapi import FastAPI, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import Depends, FastAPI, Query, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import RedirectResponse
-from fastapi.responses import JSONResponse
-from pymongo import MongoClient
+from fastapi.responses import Response
+from motor.motor_asyncio import AsyncIOMotorClient
+from bson import ObjectId
+import msgspec
+import orjson
+import redis.asyncio as redis
+from pydantic import BaseModel
+from btg.notifications.queue import notifier_worker
+from btg.serializers.transaction import BOGOTA
 from btg.use_case.use_service import UserService
-from btg.response import ResponseSuccess, ResponseFailure
+from btg.response import ResponseSuccess, ResponseFailure, ResponseTypes
 from config.settings import settings
 from .schema_swagger import (
     SuccessResponse,
@@ -35,11 +47,231 @@ from .schema_swagger import (
     NoTransactionsFoundErrorResponse,
 )
 
-# MongoDB Connection
-client = MongoClient(settings.ME_CONFIG_MONGODB_URL)
-db = client["btg_db"]
+# Redis cache for read-heavy endpoints; values are orjson-serialized bytes
+cache = redis.from_url(settings.REDIS_URL)
 
-app = FastAPI()
+USER_CACHE_KEY = "user:unique"
+CACHE_TTL_SECONDS = 300
+
+
+async def _cache_get(key: str):
+    """
+    Best-effort cache read; a Redis outage degrades to a cache miss
+    instead of failing the request.
+
+    Args:
+        key (str): The cache key to read.
+
+    Returns:
+        The cached bytes, or None on a miss or Redis error.
+    """
+    try:
+        return await cache.get(key)
+    except Exception as e:  # pylint: disable=W0718
+        print(f"Cache read failed for {key}: {e}")
+        return None
+
+
+async def _cache_set(key: str, value: bytes, ttl: int) -> None:
+    """
+    Best-effort cache write; a Redis outage only costs the caching.
+
+    Args:
+        key (str): The cache key to write.
+        value (bytes): The serialized response body to store.
+        ttl (int): Expiry in seconds.
+    """
+    try:
+        await cache.set(key, value, ex=ttl)
+    except Exception as e:  # pylint: disable=W0718
+        print(f"Cache write failed for {key}: {e}")
+
+
+async def _cache_delete(key: str) -> None:
+    """
+    Best-effort cache invalidation; a Redis outage must not turn a
+    committed write into an error response. The entry still expires with
+    its TTL, so the worst case is a bounded window of staleness.
+
+    Args:
+        key (str): The cache key to delete.
+    """
+    try:
+        await cache.delete(key)
+    except Exception as e:  # pylint: disable=W0718
+        print(f"Cache invalidation failed for {key}: {e}")
+
+
+FUNDS_REFRESH_SECONDS = 60
+FUNDS_RETRY_SECONDS = 5
+
+
+async def _refresh_funds_loop(application: FastAPI) -> None:
+    """
+    Keeps a serialized /funds response body in app state.
+
+    The fund catalog rarely mutates, so the endpoint can answer with a
+    precomputed bytes blob; this task re-reads the catalog every
+    FUNDS_REFRESH_SECONDS and re-encodes the blob once per cycle.
+
+    Args:
+        application (FastAPI): The application whose state holds the blob.
+    """
+    while True:
+        try:
+            docs = await application.state.db.funds.find(
+                {},
+                projection={"name": 1, "minimum_subscription": 1, "category": 1},
+            ).to_list(length=None)
+            if docs:
+                application.state.funds_blob = orjson.dumps(
+                    {
+                        "type": ResponseTypes.SUCCESS,
+                        "status_code": status.HTTP_200_OK,
+                        "value": docs,
+                    }
+                )
+            delay = FUNDS_REFRESH_SECONDS
+        except Exception as e:  # pylint: disable=W0718
+            # A transient Mongo error must not kill the refresher for the
+            # worker's lifetime; retry sooner than the regular cycle.
+            print(f"Failed to refresh funds blob: {e}")
+            delay = FUNDS_RETRY_SECONDS
+        await asyncio.sleep(delay)
+
+
+async def _create_indexes(db) -> None:
+    """
+    Declares the compound indexes the query paths rely on.
+
+    Existence checks and history reads are index-covered instead of
+    falling back to collection scans on non-trivial datasets.
+
+    Args:
+        db: The Motor database instance to declare the indexes on.
+    """
+    await db.funds.create_index([("minimum_subscription", 1)])
+    await db.transactions.create_index(
+        [("user_id", 1), ("fund_id", 1), ("type", 1), ("date", -1)]
+    )
+    await db.transactions.create_index([("user_id", 1), ("date", -1)])
+    await db.subscriptions.create_index([("user_id", 1), ("fund_id", 1)], unique=True)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """
+    Manages the MongoDB client for the application's lifetime.
+
+    The client is created once per worker with an explicitly sized
+    connection pool instead of at import time, so fork-based workers do
+    not share connections and the pool can be tuned against Mongo's
+    connection limit.
+
+    Args:
+        application (FastAPI): The application instance being started.
+    """
+    application.state.client = AsyncIOMotorClient(
+        settings.ME_CONFIG_MONGODB_URL,
+        maxPoolSize=20,
+        minPoolSize=5,
+        serverSelectionTimeoutMS=2000,
+        uuidRepresentation="standard",
+        appname="btg",
+        compressors="zstd",
+        # BSON stores instants without their offset; decode them back as
+        # aware Bogota datetimes so the write-time normalization survives
+        # reads and both /user and /history serialize with the -05:00 offset.
+        tz_aware=True,
+        tzinfo=BOGOTA,
+    )
+    application.state.db = application.state.client["btg_db"]
+    application.state.user_service = UserService(db=application.state.db)
+    await _create_indexes(application.state.db)
+    application.state.funds_blob = None
+    application.state.funds_refresher = asyncio.create_task(
+        _refresh_funds_loop(application)
+    )
+    application.state.notifier = asyncio.create_task(notifier_worker())
+    yield
+    application.state.notifier.cancel()
+    application.state.funds_refresher.cancel()
+    application.state.client.close()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+
+def get_service(request: Request) -> UserService:
+    """
+    FastAPI dependency that yields the app-scoped UserService singleton.
+
+    The service (and the repository inside it) is created once per worker
+    in the lifespan, so handlers share cached collection handles instead
+    of rebuilding the object graph on every request.
+
+    Args:
+        request (Request): The incoming request carrying the app state.
+
+    Returns:
+        UserService: The service instance created by the lifespan.
+    """
+    return request.app.state.user_service
+
+
+def _default(obj: any) -> any:
+    """
+    orjson fallback for the few non-native types our payloads contain.
+
+    Args:
+        obj: The object orjson could not encode natively.
+
+    Returns:
+        A JSON-encodable representation of the object.
+
+    Raises:
+        TypeError: If the object is of an unexpected type.
+    """
+    if isinstance(obj, msgspec.Struct):
+        return msgspec.to_builtins(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (ObjectId, Decimal)):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Single C-level serialization pass; naive datetimes are treated as UTC.
+_dumps = partial(
+    orjson.dumps,
+    option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    default=_default,
+)
+
+
+def _render(result: ResponseSuccess | ResponseFailure) -> Response:
+    """
+    Builds a serialized JSON response from a use-case result.
+
+    Args:
+        result: The ResponseSuccess or ResponseFailure returned by a use case.
+
+    Returns:
+        Response: The orjson-serialized response with the matching status code.
+    """
+    if result:
+        content = {
+            "type": result.type,
+            "status_code": result.status_code,
+            "value": result.value,
+        }
+    else:
+        content = result.value
+    return Response(
+        content=_dumps(content),
+        status_code=result.status_code,
+        media_type="application/json",
+    )
 
 
 @app.get(path="/", include_in_schema=False)
@@ -57,9 +289,13 @@ def root():
 
 @app.get(
     path="/funds",
-    response_model=SuccessResponse,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_200_OK: {
+            "model": SuccessResponse,
+            "description": "List of available funds",
+        },
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "model": ErrorResourceNotFound,
             "description": "Internal Server Error",
@@ -70,7 +306,7 @@ def root():
         },
     },
 )
-def get_all_funds():
+async def get_all_funds(request: Request, service: UserService = Depends(get_service)):
     """
     **Get All Funds**
 
@@ -79,17 +315,24 @@ def get_all_funds():
     **Returns**:
     - **dict**: A dictionary containing a list of funds.
     """
-    service: UserService = UserService(db)
-    funds: ResponseSuccess | ResponseFailure = service.get_all_funds()
+    blob = request.app.state.funds_blob
+    if blob is not None:
+        return Response(content=blob, media_type="application/json")
+
+    funds: ResponseSuccess | ResponseFailure = await service.get_all_funds()
 
-    return JSONResponse(content=jsonable_encoder(funds), status_code=funds.status_code)
+    return _render(funds)
 
 
 @app.get(
     path="/user",
-    response_model=UserSchema,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_200_OK: {
+            "model": UserSchema,
+            "description": "User information",
+        },
         status.HTTP_404_NOT_FOUND: {
             "model": ErrorResourceNotFound,
             "description": "User Not Found",
@@ -100,7 +343,7 @@ def get_all_funds():
         },
     },
 )
-def get_user():
+async def get_user(service: UserService = Depends(get_service)):
     """
     **Get User Information**
 
@@ -111,19 +354,27 @@ def get_user():
     **Returns**:
     - **dict**: User information or an error message.
     """
-    service: UserService = UserService(db=db)
-    user_info: ResponseSuccess | ResponseFailure = service.get_user_info()
+    cached = await _cache_get(USER_CACHE_KEY)
+    if cached:
+        return Response(content=cached, media_type="application/json")
 
-    return JSONResponse(
-        content=jsonable_encoder(user_info), status_code=user_info.status_code
-    )
+    user_info: ResponseSuccess | ResponseFailure = await service.get_user_info()
+
+    response = _render(user_info)
+    if user_info:
+        await _cache_set(USER_CACHE_KEY, response.body, CACHE_TTL_SECONDS)
+    return response
 
 
 @app.post(
     path="/subscribe/{user_id}/{fund_id}/{amount}",
-    response_model=SubscriptionCreatedResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     responses={
+        status.HTTP_201_CREATED: {
+            "model": SubscriptionCreatedResponse,
+            "description": "Subscription created.",
+        },
         status.HTTP_400_BAD_REQUEST: {
             "model": BadRequestErrorResponse,
             "description": "Bad Request due to invalid parameters.",
@@ -142,7 +393,12 @@ def get_user():
         },
     },
 )
-def subscribe(user_id: str, fund_id: str, amount: float):
+async def subscribe(
+    user_id: str,
+    fund_id: str,
+    amount: float,
+    service: UserService = Depends(get_service),
+):
     """
     **Subscribe to a Fund**
 
@@ -157,20 +413,23 @@ def subscribe(user_id: str, fund_id: str, amount: float):
     **Returns**:
     - **dict**: A success or failure message for the subscription.
     """
-    service: UserService = UserService(db=db)
-    result: ResponseSuccess | ResponseFailure = service.subscribe_to_fund(
+    result: ResponseSuccess | ResponseFailure = await service.subscribe_to_fund(
         user_id=user_id, fund_id=fund_id, amount=amount
     )
-    return JSONResponse(
-        content=jsonable_encoder(result), status_code=result.status_code
-    )
+    if result:
+        await _cache_delete(USER_CACHE_KEY)
+    return _render(result)
 
 
 @app.post(
     path="/cancel/{user_id}/{fund_id}",
-    response_model=CancellationSuccessResponse,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_200_OK: {
+            "model": CancellationSuccessResponse,
+            "description": "Subscription cancelled.",
+        },
         status.HTTP_400_BAD_REQUEST: {
             "model": NoActiveSubscriptionErrorResponse,
             "description": "Bad Request due to no active subscription.",
@@ -189,7 +448,9 @@ def subscribe(user_id: str, fund_id: str, amount: float):
         },
     },
 )
-def cancel(user_id: str, fund_id: str):
+async def cancel(
+    user_id: str, fund_id: str, service: UserService = Depends(get_service)
+):
     """
     **Cancel Subscription**
 
@@ -202,20 +463,23 @@ def cancel(user_id: str, fund_id: str):
     **Returns**:
     - **dict**: A message indicating the success or failure of the cancellation.
     """
-    service: UserService = UserService(db=db)
-    result: ResponseSuccess | ResponseFailure = service.cancel_subscription(
+    result: ResponseSuccess | ResponseFailure = await service.cancel_subscription(
         user_id=user_id, fund_id=fund_id
     )
-    return JSONResponse(
-        content=jsonable_encoder(result), status_code=result.status_code
-    )
+    if result:
+        await _cache_delete(USER_CACHE_KEY)
+    return _render(result)
 
 
 @app.get(
     path="/history/{user_id}",
-    response_model=TransactionHistorySuccessResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     responses={
+        status.HTTP_200_OK: {
+            "model": TransactionHistorySuccessResponse,
+            "description": "Transaction history for the user.",
+        },
         status.HTTP_404_NOT_FOUND: {
             "model": Union[ErrorResourceNotFound, NoTransactionsFoundErrorResponse],
             "description": "User Not Found or No Transactions Found.",
@@ -230,7 +494,12 @@ def cancel(user_id: str, fund_id: str):
         },
     },
 )
-def history(user_id: str):
+async def history(
+    user_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    before: Union[datetime, None] = None,
+    service: UserService = Depends(get_service),
+):
     """
     **Get Transaction History**
 
@@ -238,15 +507,15 @@ def history(user_id: str):
 
     **Args**:
     - **user_id** (*str*): The user's unique identifier.
+    - **limit** (*int*): Maximum number of transactions per page.
+    - **before** (*datetime*): Cursor; only transactions older than this
+      are returned.
 
     **Returns**:
-    - **dict**: The user's transaction history.
+    - **dict**: The user's transaction history, newest first.
     """
-    service: UserService = UserService(db=db)
-    result: ResponseSuccess | ResponseFailure = service.get_transaction_history(
-        user_id=user_id
+    result: ResponseSuccess | ResponseFailure = await service.get_transaction_history(
+        user_id=user_id, limit=limit, before=before
     )
 
-    return JSONResponse(
-        content=jsonable_encoder(result), status_code=result.status_code
-    )
+    return _render(result)
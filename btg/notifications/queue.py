@@ -0,0 +1,45 @@
+"""
+This module contains the background notification queue.
+
+Request handlers enqueue notification jobs with a non-blocking put; a
+worker task started at application startup drains the queue and runs the
+blocking SMTP/Twilio senders in a thread, so notifier latency or
+backpressure never cascades into API response times.
+"""
+
+# pylint: disable=W0718
+
+import asyncio
+
+# Bounded so a dead notifier backend surfaces as a visible error instead
+# of unbounded memory growth.
+notify_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
+
+def enqueue_notification(notifier, *args, **kwargs) -> None:
+    """
+    Enqueues a notification job without blocking the request path.
+
+    Args:
+        notifier: The blocking notification function to run.
+        *args: Positional arguments forwarded to the notifier.
+        **kwargs: Keyword arguments forwarded to the notifier.
+    """
+    notify_queue.put_nowait({"notifier": notifier, "args": args, "kwargs": kwargs})
+
+
+async def notifier_worker() -> None:
+    """
+    Drains the notification queue for the lifetime of the application.
+
+    Each job's blocking sender runs in a thread so the event loop stays
+    free; a failed send is reported and never interrupts the worker.
+    """
+    while True:
+        job = await notify_queue.get()
+        try:
+            await asyncio.to_thread(job["notifier"], *job["args"], **job["kwargs"])
+        except Exception as e:
+            print(f"Failed to send notification: {e}")
+        finally:
+            notify_queue.task_done()
@@ -3,8 +3,23 @@ This module contains the UserRepository class which
 interfaces with the MongoDB database. It provides methods for
 retrieving and managing users, funds, subscriptions, and transactions
 in the context of the application's business rules.
+
+Dates are normalized to the Colombian timezone when documents are written,
+so read paths can forward stored datetimes without any per-row conversion.
+Every read projects only the fields its callers consume, so bytes on the
+wire and BSON decode time stay bounded as documents grow.
 """
 
+import time
+
+from pymongo import ReturnDocument
+
+from btg.serializers.transaction import to_bogota
+
+# Funds are static reference data (five rows seeded once); cached catalog
+# reads are served from memory for this long before re-hitting Mongo.
+FUNDS_CACHE_TTL_SECONDS = 300
+
 
 class UserRepository:
     """
@@ -19,11 +34,26 @@ class UserRepository:
         Initializes the UserRepository with a MongoDB client.
 
         Args:
-            db: The MongoDB client instance that connects to the database.
+            db: The async MongoDB (Motor) client instance
+                that connects to the database.
         """
         self.db = db
-
-    def has_active_subscription(self, user_id: str, fund_id: str) -> bool:
+        # Collection handles resolved once; each attribute access on the
+        # database object builds a fresh Collection wrapper otherwise.
+        self.users = db.users
+        self.funds = db.funds
+        self.subscriptions = db.subscriptions
+        self.transactions = db.transactions
+        # Funds are static catalog data, so lookups are cached for the
+        # lifetime of the repository (one per worker).
+        self._fund_cache: dict[str, dict] = {}
+        self._all_funds_cache: list | None = None
+        self._all_funds_expiry: float = 0.0
+        # Write-through cache of user documents; every balance write either
+        # refreshes or evicts the entry, so reads never see a stale balance.
+        self._user_cache: dict[str, dict] = {}
+
+    async def has_active_subscription(self, user_id: str, fund_id: str) -> bool:
         """
         Checks if a user has an active subscription to a particular fund.
 
@@ -35,30 +65,84 @@ class UserRepository:
             bool: True if the user has an active subscription to
                   the specified fund, False otherwise.
         """
-        active_subscription = self.db.transactions.find_one(
-            {"user_id": user_id, "fund_id": fund_id, "type": "subscription"}
+        count = await self.transactions.count_documents(
+            {"user_id": user_id, "fund_id": fund_id, "type": "subscription"},
+            limit=1,
         )
-        return active_subscription is not None
+        return count > 0
 
-    def find_unique_user(self):
+    async def find_unique_user(self):
         """
         Retrieves the only user from the 'users' collection.
 
         Returns:
             dict: The first and unique user document from the collection.
         """
-        return self.db.users.find_one()
+        return await self.users.find_one(
+            projection={
+                "name": 1,
+                "email": 1,
+                "phone": 1,
+                "balance": 1,
+                "notification_preference": 1,
+            }
+        )
 
-    def find_all_funds(self):
+    async def find_all_funds(self):
         """
         Retrieves all the funds from the 'funds' collection.
 
         Returns:
             list: A list of all fund documents in the collection.
         """
-        return list(self.db.funds.find({}))
+        if self._all_funds_cache is not None and (
+            time.monotonic() < self._all_funds_expiry
+        ):
+            return self._all_funds_cache
+        funds = await self.funds.find(
+            {},
+            projection={"name": 1, "minimum_subscription": 1, "category": 1},
+        ).to_list(length=None)
+        if funds:
+            self._all_funds_cache = funds
+            self._all_funds_expiry = time.monotonic() + FUNDS_CACHE_TTL_SECONDS
+        return funds
+
+    async def find_funds_eligible(self, amount: float, excluded_ids: list):
+        """
+        Retrieves funds whose minimum subscription fits within an amount,
+        excluding funds the user is already subscribed to.
+
+        The filter runs server-side against the minimum_subscription index
+        instead of dragging the whole catalog to the client.
+
+        Args:
+            amount: The amount available to invest.
+            excluded_ids: Fund ids to leave out of the result.
+
+        Returns:
+            list: The eligible fund documents.
+        """
+        return await self.funds.find(
+            {
+                "minimum_subscription": {"$lte": amount},
+                "_id": {"$nin": excluded_ids},
+            },
+            projection={"name": 1, "minimum_subscription": 1, "category": 1},
+        ).to_list(length=None)
+
+    def invalidate_funds(self) -> None:
+        """
+        Clears the cached fund catalog and per-fund lookups.
+
+        Meant to be called from any future fund-mutation path so admin
+        writes become visible before the TTL expires.
+        """
+        self._fund_cache.clear()
+        self._all_funds_cache = None
+        self._all_funds_expiry = 0.0
 
-    def find_user(self, user_id: str):
+    async def find_user(self, user_id: str):
         """
         Retrieves a user by their unique ID.
 
@@ -68,9 +152,25 @@ class UserRepository:
         Returns:
             dict: The user document if found, None otherwise.
         """
-        return self.db.users.find_one({"_id": user_id})
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+        user = await self.users.find_one(
+            {"_id": user_id},
+            projection={
+                "_id": 0,
+                "name": 1,
+                "email": 1,
+                "phone": 1,
+                "balance": 1,
+                "notification_preference": 1,
+            },
+        )
+        if user:
+            self._user_cache[user_id] = user
+        return user
 
-    def find_fund(self, fund_id: str):
+    async def find_fund(self, fund_id: str):
         """
         Retrieves a fund by its unique ID.
 
@@ -80,9 +180,23 @@ class UserRepository:
         Returns:
             dict: The fund document if found, None otherwise.
         """
-        return self.db.funds.find_one({"_id": fund_id})
+        fund = self._fund_cache.get(fund_id)
+        if fund is not None:
+            return fund
+        fund = await self.funds.find_one(
+            {"_id": fund_id},
+            projection={
+                "_id": 0,
+                "name": 1,
+                "minimum_subscription": 1,
+                "category": 1,
+            },
+        )
+        if fund:
+            self._fund_cache[fund_id] = fund
+        return fund
 
-    def update_user_balance_and_transactions(
+    async def update_user_balance_and_transactions(
         self, user_id: str, amount: float, transaction
     ) -> None:
         """
@@ -95,19 +209,152 @@ class UserRepository:
             transaction: The transaction document to be inserted into the
                         'transactions' collection.
         """
-        self.db.users.update_one({"_id": user_id}, {"$inc": {"balance": amount}})
-        self.db.transactions.insert_one(transaction)
+        await self.users.update_one({"_id": user_id}, {"$inc": {"balance": amount}})
+        await self.transactions.insert_one(transaction)
+        self._user_cache.pop(user_id, None)
+
+    async def load_subscription_context(self, user_id: str, fund_id: str):
+        """
+        Loads the user, the fund, and the user's active subscription to that
+        fund in a single aggregation round-trip.
+
+        Args:
+            user_id: The unique ID of the user.
+            fund_id: The unique ID of the fund.
+
+        Returns:
+            dict: The user document with 'fund' and 'active_subscription'
+                  arrays attached (each empty or holding one document), or
+                  None if the user does not exist.
+        """
+        pipeline = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "funds",
+                    "pipeline": [
+                        {"$match": {"_id": fund_id}},
+                        {"$project": {"_id": 0}},
+                    ],
+                    "as": "fund",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "subscriptions",
+                    "pipeline": [
+                        {"$match": {"user_id": user_id, "fund_id": fund_id}},
+                        {"$limit": 1},
+                    ],
+                    "as": "active_subscription",
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "name": 1,
+                    "email": 1,
+                    "phone": 1,
+                    "balance": 1,
+                    "notification_preference": 1,
+                    "fund": 1,
+                    "active_subscription": 1,
+                }
+            },
+        ]
+        docs = await self.users.aggregate(pipeline).to_list(length=1)
+        return docs[0] if docs else None
+
+    async def debit_user_balance(self, user_id: str, amount: float):
+        """
+        Atomically debits an amount from the user's balance, guarded by a
+        server-side balance check so no separate read is needed.
+
+        Args:
+            user_id: The unique ID of the user.
+            amount: The amount to subtract from the user's balance.
+
+        Returns:
+            dict: The updated user document if the user exists and had
+                  sufficient balance, None otherwise.
+        """
+        user = await self.users.find_one_and_update(
+            {"_id": user_id, "balance": {"$gte": amount}},
+            {"$inc": {"balance": -amount}},
+            projection={
+                "_id": 0,
+                "name": 1,
+                "email": 1,
+                "phone": 1,
+                "balance": 1,
+                "notification_preference": 1,
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        if user:
+            self._user_cache[user_id] = user
+        else:
+            self._user_cache.pop(user_id, None)
+        return user
+
+    async def add_subscription_and_transaction(
+        self, subscription: dict, transaction: dict
+    ) -> None:
+        """
+        Inserts a subscription and its transaction log entry sequentially.
+
+        The two inserts target different collections, so a collection-level
+        bulk_write cannot batch them; multi-document sessions would couple
+        them, but those require a replica set and the shipped compose runs
+        a standalone mongod. The subscription goes first: a crash between
+        the writes then leaves a subscription without a log entry, which the
+        caller's compensation path can still unwind.
+
+        Args:
+            subscription: A dictionary containing the subscription data.
+            transaction: A dictionary containing the transaction data.
+        """
+        subscription["date"] = to_bogota(subscription["date"])
+        transaction["date"] = to_bogota(transaction["date"])
+        await self.subscriptions.insert_one(subscription)
+        await self.transactions.insert_one(transaction)
 
-    def add_subscription(self, subscription: dict) -> None:
+    async def commit_cancellation(
+        self, cancellation: dict, subscription_id: str, user_id: str, amount: float
+    ) -> None:
+        """
+        Applies the three cancellation mutations in order: log the
+        cancellation, remove the subscription, and refund the balance.
+
+        Multi-document transactions would make the trio atomic, but they
+        require a replica set and the shipped compose runs a standalone
+        mongod. The refund is deliberately last so a mid-way crash leaves a
+        logged cancellation without a refund — detectable from the log —
+        rather than money credited with the subscription still active.
+
+        Args:
+            cancellation: The cancellation transaction document to insert.
+            subscription_id: The unique ID of the subscription to remove.
+            user_id: The unique ID of the user to refund.
+            amount: The amount to credit back to the user's balance.
+        """
+        cancellation["date"] = to_bogota(cancellation["date"])
+        await self.transactions.insert_one(cancellation)
+        await self.subscriptions.delete_one({"subscription_id": subscription_id})
+        await self.users.update_one({"_id": user_id}, {"$inc": {"balance": amount}})
+        self._user_cache.pop(user_id, None)
+
+    async def add_subscription(self, subscription: dict) -> None:
         """
         Registers a new subscription in the 'subscriptions' collection.
 
         Args:
             subscription: A dictionary containing the subscription data.
         """
-        self.db.subscriptions.insert_one(subscription)
+        subscription["date"] = to_bogota(subscription["date"])
+        await self.subscriptions.insert_one(subscription)
 
-    def find_last_subscription(self, user_id: str, fund_id: str):
+    async def find_last_subscription(self, user_id: str, fund_id: str):
         """
         Finds the most recent active subscription for a user and a specific fund.
 
@@ -118,27 +365,30 @@ class UserRepository:
         Returns:
             dict: The most recent subscription document if found, None otherwise.
         """
-        return self.db.subscriptions.find_one({"user_id": user_id, "fund_id": fund_id})
+        return await self.subscriptions.find_one(
+            {"user_id": user_id, "fund_id": fund_id}
+        )
 
-    def remove_subscription(self, subscription_id: str) -> None:
+    async def remove_subscription(self, subscription_id: str) -> None:
         """
         Removes an active subscription from the 'subscriptions' collection.
 
         Args:
             subscription_id: The unique ID of the subscription to be removed.
         """
-        self.db.subscriptions.delete_one({"subscription_id": subscription_id})
+        await self.subscriptions.delete_one({"subscription_id": subscription_id})
 
-    def add_transaction(self, transaction: dict) -> None:
+    async def add_transaction(self, transaction: dict) -> None:
         """
         Registers a transaction in the 'transactions' collection.
 
         Args:
             transaction: A dictionary containing the transaction data.
         """
-        self.db.transactions.insert_one(transaction)
+        transaction["date"] = to_bogota(transaction["date"])
+        await self.transactions.insert_one(transaction)
 
-    def update_user_balance(self, user_id: str, amount: float) -> None:
+    async def update_user_balance(self, user_id: str, amount: float) -> None:
         """
         Updates the user's balance in the 'users' collection.
 
@@ -146,17 +396,38 @@ class UserRepository:
             user_id: The unique ID of the user.
             amount: The amount to add to or subtract from the user's balance.
         """
-        self.db.users.update_one({"_id": user_id}, {"$inc": {"balance": amount}})
+        await self.users.update_one({"_id": user_id}, {"$inc": {"balance": amount}})
+        self._user_cache.pop(user_id, None)
 
-    def get_transactions(self, user_id: str):
+    async def get_transactions(self, user_id: str, limit: int = None, before=None):
         """
-        Retrieves all transactions for a specific user
-        from the 'transactions' collection.
+        Retrieves transactions for a specific user from the 'transactions'
+        collection, newest first, with optional cursor-based pagination.
 
         Args:
             user_id: The unique ID of the user.
+            limit: Maximum number of transactions to return; None returns all.
+            before: Only return transactions strictly older than this datetime.
 
         Returns:
             list: A list of transaction documents related to the user.
         """
-        return list(self.db.transactions.find({"user_id": user_id}))
+        query = {"user_id": user_id}
+        if before is not None:
+            query["date"] = {"$lt": before}
+        cursor = self.transactions.find(
+            query,
+            projection={
+                "_id": 0,
+                "transaction_id": 1,
+                "user_id": 1,
+                "fund_id": 1,
+                "amount": 1,
+                "type": 1,
+                "date": 1,
+            },
+        ).sort("date", -1)
+        if limit is not None:
+            # batch_size == limit avoids a second getMore round-trip.
+            cursor = cursor.limit(limit).batch_size(limit)
+        return await cursor.to_list(length=limit)
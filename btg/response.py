@@ -8,6 +8,8 @@ types to HTTP status codes, and the `ResponseFailure` and
 
 # pylint: disable=R0903
 
+import sys
+
 from starlette import status
 
 
@@ -16,12 +18,14 @@ class ResponseTypes:
     Defines different types of responses and maps them to HTTP status codes.
     """
 
-    PARAMETERS_ERROR = "ParametersError"
-    RESOURCE_ERROR = "ResourceError"
-    CONFLICT_ERROR = "ConflictError"
-    SYSTEM_ERROR = "SystemError"
-    SUCCESS = "Success"
-    CREATED = "Created"
+    # Interned so every response shares one string object per type and
+    # downstream dict-key comparisons are pointer checks.
+    PARAMETERS_ERROR = sys.intern("ParametersError")
+    RESOURCE_ERROR = sys.intern("ResourceError")
+    CONFLICT_ERROR = sys.intern("ConflictError")
+    SYSTEM_ERROR = sys.intern("SystemError")
+    SUCCESS = sys.intern("Success")
+    CREATED = sys.intern("Created")
 
     # Map response types to HTTP status codes
     STATUS_CODES = {
@@ -34,12 +38,19 @@ class ResponseTypes:
     }
 
 
+# Bound method resolved once at import time so each response construction
+# does a single call instead of re-fetching the class attribute and `.get`.
+_status_code_for = ResponseTypes.STATUS_CODES.get
+
+
 class ResponseFailure:
     """
     Represents a failed response, encapsulating the error type,
     message, and HTTP status code.
     """
 
+    __slots__ = ("type", "status_code", "message", "_value")
+
     def __init__(self, type_: str, message: str | Exception) -> None:
         """
         Initializes a ResponseFailure instance with the given type and message.
@@ -50,10 +61,13 @@ class ResponseFailure:
                                         error or an Exception instance.
         """
         self.type = type_
-        self.status_code = ResponseTypes.STATUS_CODES.get(
-            type_, status.HTTP_400_BAD_REQUEST
-        )
+        self.status_code = _status_code_for(type_, status.HTTP_400_BAD_REQUEST)
         self.message = self._format_message(msg=message)
+        self._value = {
+            "type": self.type,
+            "message": self.message,
+            "status_code": self.status_code,
+        }
 
     def _format_message(self, msg: str | Exception) -> str:
         """
@@ -79,11 +93,7 @@ class ResponseFailure:
         Returns:
             dict: A dictionary containing the error type and message.
         """
-        return {
-            "type": self.type,
-            "message": self.message,
-            "status_code": self.status_code,
-        }
+        return self._value
 
     def __bool__(self) -> bool:
         """
@@ -100,6 +110,8 @@ class ResponseSuccess:
     Represents a successful response, containing the result value and HTTP status code.
     """
 
+    __slots__ = ("type", "status_code", "value")
+
     def __init__(self, response_type: str = ResponseTypes.SUCCESS, value: any = None):
         """
         Initializes a ResponseSuccess instance with an optional result value.
@@ -108,7 +120,7 @@ class ResponseSuccess:
             value: The result data to include in the response.
         """
         self.type: str = response_type
-        self.status_code = ResponseTypes.STATUS_CODES.get(self.type)
+        self.status_code = _status_code_for(self.type)
         self.value: any = value
 
     def __bool__(self) -> bool:
@@ -1,26 +1,48 @@
 """
-This module contains serializers for transaction data using Pydantic models.
+This module contains serializers for transaction data using msgspec structs.
 
-The `Transaction` model represents a single transaction, while the `TransactionList`
-model handles a list of transactions. These serializers facilitate the conversion of
-MongoDB documents into Python objects and ensure proper validation of the
-transaction data. The models can also easily convert Python objects into
-JSON format, making it easier to work with transaction data in web applications.
+The `Transaction` struct represents a single transaction; history responses
+serialize a bare `list[Transaction]` directly. msgspec structs are
+instantiated in C without per-field Python validator calls, which keeps the
+read-heavy history path cheap: documents read back from Mongo were validated
+and timezone-normalized at write time, so no validation is needed here.
 """
 
-# pylint: disable=R0903, E0213, R0801
+# pylint: disable=R0903
 
-from typing import List, Optional
-from datetime import datetime
-from pydantic import BaseModel, field_validator
-import pytz
+from typing import List
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+import msgspec
 
+# Timezone objects resolved once at import time. zoneinfo caches key lookups
+# internally, unlike pytz.timezone() which re-resolves on every call.
+UTC = timezone.utc
+BOGOTA = ZoneInfo("America/Bogota")
 
-class Transaction(BaseModel):
+
+def to_bogota(value: datetime) -> datetime:
+    """
+    Normalizes a datetime to the 'America/Bogota' (Colombian) timezone.
+
+    Naive datetimes are assumed to be UTC; `replace(tzinfo=UTC)` is a
+    C-level struct copy, so the whole normalization is a single
+    `astimezone` call per record.
+
+    Args:
+        value (datetime): The datetime object to be adjusted.
+
+    Returns:
+        datetime: The datetime adjusted to the 'America/Bogota' timezone.
     """
-    A Pydantic model representing a transaction, which could
+    return (value if value.tzinfo else value.replace(tzinfo=UTC)).astimezone(BOGOTA)
+
+
+class Transaction(msgspec.Struct, frozen=True):
+    """
+    A msgspec struct representing a transaction, which could
     either be a subscription or a cancellation.
-    This model is used to standardize and validate transaction data.
+    This struct is used to standardize transaction data.
     """
 
     transaction_id: str
@@ -29,53 +51,9 @@ class Transaction(BaseModel):
     amount: float
     type: str  # "subscription" or "cancellation"
     date: datetime
-    _id: Optional[str] = None  # To handle MongoDB ObjectId
-
-    @field_validator("date", mode="before")
-    def set_timezone(cls, v):
-        """
-        Adjusts the timezone of a given datetime object to 'America/Bogota'
-        (Colombian timezone).
-
-        If the datetime object is naive (i.e., it has no timezone information),
-        it is first localized to UTC. Then, the datetime is converted to the
-        'America/Bogota' timezone.
-
-        Args:
-            v (datetime): The datetime object to be adjusted.
-
-        Returns:
-            datetime: The datetime object adjusted to the 'America/Bogota' timezone.
-
-        Raises:
-            ValueError: If the input is not a valid datetime object.
-        """
-        if isinstance(v, datetime):
-            if v.tzinfo is None:
-                utc = pytz.utc
-                v = utc.localize(v)
-            colombia_tz = pytz.timezone("America/Bogota")
-            return v.astimezone(colombia_tz)
-        raise ValueError("Invalid datetime format")
-
-
-class TransactionList(BaseModel):
-    """
-    A Pydantic model that represents a list of transactions.
-    This model is used to validate and group multiple
-    transactions into a single object for easier management.
-    """
-
-    transactions: List[Transaction]
-
-    class Config:
-        """
-        Configuration for the Pydantic model.
 
-        Attributes:
-            arbitrary_types_allowed (bool): Allows Pydantic to accept types that are
-                                            not natively supported,
-            such as MongoDB's ObjectId.
-        """
 
-        arbitrary_types_allowed = True
+# Shared encoder/decoder instances; building them is not free, so the hot
+# path reuses these instead of constructing one per request.
+json_encoder = msgspec.json.Encoder()
+json_decoder = msgspec.json.Decoder(List[Transaction])
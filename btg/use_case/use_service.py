@@ -3,12 +3,15 @@ This module implements the use cases for our technical test.
 
 It contains the logic for managing user subscriptions, fund management,
 transaction history retrieval, and other related business operations.
-All operations interact with MongoDB through the UserRepository.
+All operations interact with MongoDB asynchronously through the
+UserRepository, which drives the Motor driver so the event loop can
+service other requests during network waits.
 The responses are standardized using ResponseSuccess and ResponseFailure.
 """
 
 # pylint: disable=E0401, E0611, W0718, R0911
 
+import asyncio
 from datetime import datetime
 import uuid
 import smtplib
@@ -16,10 +19,10 @@ import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from twilio.rest import Client
-import pytz
+from btg.notifications.queue import enqueue_notification
 from btg.repository.user_repository import UserRepository
 from btg.response import ResponseSuccess, ResponseFailure, ResponseTypes
-from btg.serializers.transaction import TransactionList
+from btg.serializers.transaction import BOGOTA, Transaction
 from config.settings import settings
 
 
@@ -98,7 +101,7 @@ class UserService:
         """
         self.repository = UserRepository(db=db)
 
-    def get_all_funds(self) -> ResponseSuccess | ResponseFailure:
+    async def get_all_funds(self) -> ResponseSuccess | ResponseFailure:
         """
         Retrieves all available funds from the database.
 
@@ -109,7 +112,7 @@ class UserService:
             ResponseSuccess: Contains the list of funds if funds are available.
             ResponseFailure: Returns a system error if no funds are found.
         """
-        funds = self.repository.find_all_funds()
+        funds = await self.repository.find_all_funds()
         if not funds:
             return ResponseFailure(
                 type_=ResponseTypes.SYSTEM_ERROR,
@@ -117,7 +120,7 @@ class UserService:
             )
         return ResponseSuccess(value=funds)
 
-    def get_user_info(self) -> ResponseSuccess | ResponseFailure:
+    async def get_user_info(self) -> ResponseSuccess | ResponseFailure:
         """
         Retrieves the unique user information from the database.
 
@@ -125,18 +128,18 @@ class UserService:
             ResponseSuccess: If the user is found, returns the user information.
             ResponseFailure: If no user is found, returns an error message.
         """
-        user = self.repository.find_unique_user()
+        user = await self.repository.find_unique_user()
         if not user:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR, message="User not found"
             )
 
-        transactions = self.repository.get_transactions(user["_id"])
-        user["transactions"] = TransactionList(transactions=transactions).transactions
+        transactions = await self.repository.get_transactions(user["_id"])
+        user["transactions"] = [Transaction(**doc) for doc in transactions]
 
         return ResponseSuccess(value=user)
 
-    def subscribe_to_fund(
+    async def subscribe_to_fund(
         self, user_id: str, fund_id: str, amount: float
     ) -> ResponseSuccess | ResponseFailure:
         """
@@ -154,20 +157,26 @@ class UserService:
             ResponseFailure: If the subscription fails due to insufficient balance,
                              already active subscription, or other validation issues.
         """
-        user = self.repository.find_user(user_id)
+        # The three precheck reads are independent, so their network waits
+        # overlap instead of paying serial round-trips. The user check stays
+        # first to preserve the baseline error precedence.
+        user, fund, active_subscription = await asyncio.gather(
+            self.repository.find_user(user_id),
+            self.repository.find_fund(fund_id),
+            self.repository.find_last_subscription(user_id, fund_id),
+        )
         if not user:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR, message="User not found"
             )
 
-        fund = self.repository.find_fund(fund_id)
         if not fund:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR,
                 message=f"Fund {fund_id} does not exist.",
             )
 
-        if self.repository.find_last_subscription(user_id, fund_id):
+        if active_subscription:
             message: str = (
                 f"You are already subscribed to fund {fund['name']}. "
                 f"You must cancel your "
@@ -187,6 +196,7 @@ class UserService:
             return ResponseFailure(
                 type_=ResponseTypes.PARAMETERS_ERROR, message=message
             )
+
         if amount < fund["minimum_subscription"]:
             message: str = (
                 f"The minimum amount to subscribe to the fund {fund['name']} is "
@@ -196,46 +206,61 @@ class UserService:
                 type_=ResponseTypes.PARAMETERS_ERROR, message=message
             )
 
-        # Define the time zone of Colombia
-        timezone_colombia = pytz.timezone("America/Bogota")
+        # The debit re-checks the balance server-side in one atomic
+        # operation; a None result here means a concurrent write drained
+        # the balance between the precheck and the debit.
+        debited = await self.repository.debit_user_balance(user_id, amount)
+        if not debited:
+            message: str = (
+                f"The amount you tried to subscribe ({amount:.2f}) is "
+                f"greater than your available balance."
+            )
+            return ResponseFailure(
+                type_=ResponseTypes.PARAMETERS_ERROR, message=message
+            )
+
+        now = datetime.now(BOGOTA)
 
         subscription = {
-            "subscription_id": str(uuid.uuid4()),
+            "subscription_id": uuid.uuid4().hex,
             "user_id": user_id,
             "fund_id": fund_id,
             "amount": amount,
-            "date": datetime.now(timezone_colombia),
+            "date": now,
         }
 
-        try:
-            self.repository.add_subscription(subscription)
-
-            transaction = {
-                "transaction_id": str(uuid.uuid4()),
-                "user_id": user_id,
-                "fund_id": fund_id,
-                "amount": amount,
-                "type": "subscription",
-                "date": datetime.now(timezone_colombia),
-            }
-
-            self.repository.add_transaction(transaction)
-            self.repository.update_user_balance(user_id, -amount)
-
-            self._send_notifications(
-                user=user,
-                message=f"You have subscribed to fund {fund['name']} for {amount}.",
-                fund=fund["name"],
-            )
+        transaction = {
+            "transaction_id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "fund_id": fund_id,
+            "amount": amount,
+            "type": "subscription",
+            "date": now,
+        }
 
-            return ResponseSuccess(
-                value=f"Successful subscription to fund {fund['name']}",
-                response_type=ResponseTypes.CREATED,
+        try:
+            await self.repository.add_subscription_and_transaction(
+                subscription, transaction
             )
         except Exception as e:
+            # The balance was already debited; compensate before reporting.
+            await self.repository.update_user_balance(user_id, amount)
             return ResponseFailure(ResponseTypes.SYSTEM_ERROR, str(e))
 
-    def _find_funds_within_amount(self, user, amount):
+        # The writes are committed; a notification problem must not reach
+        # the compensation path above or fail the request.
+        self._send_notifications(
+            user=user,
+            message=f"You have subscribed to fund {fund['name']} for {amount}.",
+            fund=fund["name"],
+        )
+
+        return ResponseSuccess(
+            value=f"Successful subscription to fund {fund['name']}",
+            response_type=ResponseTypes.CREATED,
+        )
+
+    async def _find_funds_within_amount(self, user, amount):
         """
         Finds funds that the user can subscribe to based on
         the amount they are willing to invest.
@@ -247,28 +272,20 @@ class UserService:
         Returns:
             list: A list of funds the user can subscribe to.
         """
-        funds = self.repository.find_all_funds()
-
-        active_fund_ids = {
-            txn["fund_id"]
-            for txn in user["transactions"]
-            if txn["type"] == "subscription"
-            and not any(
-                c["fund_id"] == txn["fund_id"] and c["type"] == "cancellation"
-                for c in user["transactions"]
-            )
-        }
-
-        available_funds = [
-            fund
-            for fund in funds
-            if fund["minimum_subscription"] <= amount
-            and fund["_id"] not in active_fund_ids
-        ]
-
-        return available_funds
-
-    def _find_funds_within_balance(self, balance):
+        # Single pass over the history instead of re-scanning the list for
+        # every subscription entry.
+        subscribed = set()
+        cancelled = set()
+        for txn in user["transactions"]:
+            if txn["type"] == "subscription":
+                subscribed.add(txn["fund_id"])
+            elif txn["type"] == "cancellation":
+                cancelled.add(txn["fund_id"])
+        active_fund_ids = subscribed - cancelled
+
+        return await self.repository.find_funds_eligible(amount, list(active_fund_ids))
+
+    async def _find_funds_within_balance(self, balance):
         """
         Finds funds the user can subscribe to based on their current balance.
 
@@ -278,10 +295,10 @@ class UserService:
         Returns:
             list: A list of funds the user can afford to subscribe to.
         """
-        funds = self.repository.find_all_funds()
+        funds = await self.repository.find_all_funds()
         return [fund for fund in funds if fund["minimum_subscription"] <= balance]
 
-    def cancel_subscription(
+    async def cancel_subscription(
         self, user_id: str, fund_id: str
     ) -> ResponseSuccess | ResponseFailure:
         """
@@ -297,100 +314,125 @@ class UserService:
             ResponseFailure: If the cancellation fails, either due to the user not being
                              subscribed to the fund or other issues.
         """
-        user = self.repository.find_user(user_id)
+        # One aggregation replaces the find_user / find_fund /
+        # find_last_subscription round-trips.
+        user = await self.repository.load_subscription_context(user_id, fund_id)
         if not user:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR, message="User not found"
             )
 
-        fund = self.repository.find_fund(fund_id)
+        fund = user["fund"][0] if user["fund"] else None
         if not fund:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR,
                 message=f"Fund {fund_id} does not exist.",
             )
 
-        active_subscription = self.repository.find_last_subscription(user_id, fund_id)
+        active_subscription = (
+            user["active_subscription"][0] if user["active_subscription"] else None
+        )
         if not active_subscription:
             message = f"No active subscription found for fund {fund['name']}"
             return ResponseFailure(
                 type_=ResponseTypes.PARAMETERS_ERROR, message=message
             )
 
-        # Define the time zone of Colombia
-        timezone_colombia = pytz.timezone("America/Bogota")
-
         cancellation = {
-            "transaction_id": str(uuid.uuid4()),
+            "transaction_id": uuid.uuid4().hex,
             "user_id": user_id,
             "fund_id": fund_id,
             "amount": active_subscription["amount"],
             "type": "cancellation",
             "subscription_id": active_subscription["subscription_id"],
-            "date": datetime.now(timezone_colombia),
+            "date": datetime.now(BOGOTA),
         }
 
         try:
-            self.repository.add_transaction(cancellation)
-            self.repository.remove_subscription(active_subscription["subscription_id"])
-            self.repository.update_user_balance(user_id, active_subscription["amount"])
-
-            self._send_notifications(
-                user=user,
-                message=(
-                    f"You have cancelled your subscription to fund {fund['name']} and "
-                    f"have been refunded {active_subscription['amount']}."
-                ),
-                fund=fund["name"],
-            )
-
-            return ResponseSuccess(
-                value=f"Successful cancellation of subscription to fund {fund['name']}",
-                response_type=ResponseTypes.CREATED,
+            await self.repository.commit_cancellation(
+                cancellation,
+                active_subscription["subscription_id"],
+                user_id,
+                active_subscription["amount"],
             )
         except Exception as e:
             return ResponseFailure(type_=ResponseTypes.SYSTEM_ERROR, message=str(e))
 
-    def get_transaction_history(
-        self, user_id: str
+        # The cancellation is committed; a notification problem must not
+        # turn it into an error response.
+        self._send_notifications(
+            user=user,
+            message=(
+                f"You have cancelled your subscription to fund {fund['name']} and "
+                f"have been refunded {active_subscription['amount']}."
+            ),
+            fund=fund["name"],
+        )
+
+        return ResponseSuccess(
+            value=f"Successful cancellation of subscription to fund {fund['name']}",
+            response_type=ResponseTypes.CREATED,
+        )
+
+    async def get_transaction_history(
+        self, user_id: str, limit: int = 50, before: datetime = None
     ) -> ResponseSuccess | ResponseFailure:
         """
-        Retrieves the transaction history of a user.
+        Retrieves the transaction history of a user, newest first.
 
         Args:
             user_id (str): The unique identifier for the user.
+            limit (int): Maximum number of transactions per page.
+            before (datetime): Cursor; only transactions older than this
+                               are returned.
 
         Returns:
             ResponseSuccess: If transactions are found, returns the list of
                              transactions.
             ResponseFailure: If no transactions are found or the user does not exist.
         """
-        user = self.repository.find_user(user_id)
+        user = await self.repository.find_user(user_id)
         if not user:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR, message="User not found"
             )
 
-        transactions = self.repository.get_transactions(user_id)
+        transactions = await self.repository.get_transactions(
+            user_id, limit=limit, before=before
+        )
         if not transactions:
             return ResponseFailure(
                 type_=ResponseTypes.RESOURCE_ERROR,
                 message="No transactions found for this user.",
             )
 
-        return ResponseSuccess(
-            value=TransactionList(transactions=transactions).transactions
-        )
+        # The documents are already projected to the exact response fields,
+        # so they are forwarded as-is and encoded directly by orjson without
+        # constructing a Python object per row.
+        return ResponseSuccess(value=transactions)
 
     def _send_notifications(self, user, message: str, fund: str):
         """
-        Sends notifications to the user based on their preferences.
+        Enqueues notifications to the user based on their preferences.
+
+        The request-path cost is a queue put; the worker task drains the
+        queue and pays the SMTP/Twilio round-trips off the critical path.
 
         Args:
             user (dict): The user object containing notification preferences.
             message (str): The message to be sent to the user.
+            fund (str): The name of the fund the notification refers to.
         """
-        if "email" in user["notification_preference"]:
-            send_email(recipient_email=user["email"], message=message, fund=fund)
-        if "sms" in user["notification_preference"]:
-            send_sms(user["phone"], message)
+        try:
+            if "email" in user["notification_preference"]:
+                enqueue_notification(
+                    send_email,
+                    recipient_email=user["email"],
+                    message=message,
+                    fund=fund,
+                )
+            if "sms" in user["notification_preference"]:
+                enqueue_notification(send_sms, user["phone"], message)
+        except Exception as e:
+            # A full queue only costs the notification, never the request.
+            print(f"Failed to enqueue notification: {e}")
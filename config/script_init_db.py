@@ -77,3 +77,14 @@ funds_data = [
 # Insert the funds into the 'funds' collection within the database
 result = db.funds.insert_many(funds_data)
 print("Funds inserted:", result.inserted_ids)  # Print the IDs of the inserted funds
+
+# Declare the compound indexes the query paths rely on so they exist even
+# when the database is seeded before the app starts. Queries must use the
+# full index prefix to be served without a collection scan.
+db.funds.create_index([("minimum_subscription", 1)])
+db.subscriptions.create_index([("user_id", 1), ("fund_id", 1)], unique=True)
+db.transactions.create_index([("user_id", 1), ("date", -1)])
+db.transactions.create_index(
+    [("user_id", 1), ("fund_id", 1), ("type", 1), ("date", -1)]
+)
+print("Indexes created for funds, subscriptions, and transactions")
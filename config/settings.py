@@ -35,6 +35,9 @@ class Settings(BaseSettings):
     MONGO_INITDB_ROOT_USERNAME: str
     MONGO_INITDB_ROOT_PASSWORD: str
 
+    # Redis Config
+    REDIS_URL: str = "redis://btg_redis:6379/0"
+
     # Gmail Config
     GMAIL_USER: str
     GMAIL_PASSWORD: str
@@ -0,0 +1,40 @@
+"""
+Shared pytest configuration for the suite.
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm():
+    """
+    Warms the btg modules once per session (per xdist worker): imports the
+    serializer, response, and repository modules and runs one encode/decode
+    through the shared msgspec pair, so the fixed import and first-call
+    costs land here instead of in whichever test happens to run first.
+    """
+    # pylint: disable=C0415, W0611
+    from btg.repository.user_repository import UserRepository  # noqa: F401
+    from btg.response import ResponseFailure, ResponseSuccess  # noqa: F401
+    from btg.serializers.transaction import (
+        Transaction,
+        json_decoder,
+        json_encoder,
+    )
+
+    json_decoder.decode(
+        json_encoder.encode(
+            [
+                Transaction(
+                    transaction_id="warmup",
+                    user_id="warmup",
+                    fund_id="warmup",
+                    amount=0.0,
+                    type="subscription",
+                    date=datetime(2024, 1, 1),
+                )
+            ]
+        )
+    )
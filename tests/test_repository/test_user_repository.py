@@ -0,0 +1,283 @@
+"""
+Tests for the UserRepository data-access layer.
+
+The eleven near-identical CRUD tests are collapsed into one table-driven
+test: each case names the repository method, its arguments, the expected
+return value, and optionally a post-condition to check against the
+database, so a new method costs one table row instead of another function
+plus fixture setup.
+
+The database is an in-memory mongomock instance rather than a MagicMock
+tree: queries run against real documents, so the assertions check actual
+state instead of recorded call arguments.
+"""
+
+from datetime import datetime
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from btg.repository.user_repository import UserRepository
+
+SEED_USER = {
+    "_id": "user123",
+    "name": "Emmanuel",
+    "email": "emmanuel@example.com",
+    "phone": "+573001234567",
+    "balance": 500000.0,
+    "notification_preference": "email",
+}
+SEED_FUNDS = [
+    {
+        "_id": "fund123",
+        "name": "FPV_BTG_PACTUAL_RECAUDADORA",
+        "minimum_subscription": 75000,
+        "category": "FPV",
+    },
+    {
+        "_id": "fund456",
+        "name": "FDO-ACCIONES",
+        "minimum_subscription": 250000,
+        "category": "FIC",
+    },
+]
+SEED_SUBSCRIPTION = {
+    "_id": "sub-oid123",
+    "subscription_id": "sub123",
+    "user_id": "user123",
+    "fund_id": "fund123",
+    "amount": 100000.0,
+    "date": datetime(2024, 1, 1, 12, 0, 0),
+}
+SEED_TRANSACTION = {
+    "_id": "txn-oid123",
+    "transaction_id": "txn123",
+    "user_id": "user123",
+    "fund_id": "fund123",
+    "amount": 100000.0,
+    "type": "subscription",
+    "date": datetime(2024, 1, 1, 12, 0, 0),
+}
+
+# Each case drives one repository method. `setup` optionally pre-inserts a
+# document, `expected` is the return value, and `state` is an optional list
+# of post-conditions: (collection, filter, should_exist).
+CASES = [
+    {
+        "name": "find_unique_user",
+        "method": "find_unique_user",
+        "args": (),
+        "expected": SEED_USER,
+    },
+    {
+        "name": "find_user",
+        "method": "find_user",
+        "args": ("user123",),
+        "expected": {k: v for k, v in SEED_USER.items() if k != "_id"},
+    },
+    {
+        "name": "find_fund",
+        "method": "find_fund",
+        "args": ("fund123",),
+        "expected": {k: v for k, v in SEED_FUNDS[0].items() if k != "_id"},
+    },
+    {
+        "name": "find_all_funds",
+        "method": "find_all_funds",
+        "args": (),
+        "expected": SEED_FUNDS,
+    },
+    {
+        "name": "add_subscription",
+        "method": "add_subscription",
+        "args": (
+            {
+                "subscription_id": "sub999",
+                "user_id": "user123",
+                "fund_id": "fund456",
+                "amount": 250000.0,
+                "date": datetime(2024, 2, 1, 12, 0, 0),
+                "_test_mutation": True,
+            },
+        ),
+        "expected": None,
+        "state": [("subscriptions", {"subscription_id": "sub999"}, True)],
+    },
+    {
+        "name": "add_transaction",
+        "method": "add_transaction",
+        "args": (
+            {
+                "transaction_id": "txn999",
+                "user_id": "user123",
+                "fund_id": "fund456",
+                "amount": 250000.0,
+                "type": "subscription",
+                "date": datetime(2024, 2, 1, 12, 0, 0),
+                "_test_mutation": True,
+            },
+        ),
+        "expected": None,
+        "state": [("transactions", {"transaction_id": "txn999"}, True)],
+    },
+    {
+        "name": "add_subscription_and_transaction",
+        "method": "add_subscription_and_transaction",
+        "args": (
+            {
+                "subscription_id": "sub888",
+                "user_id": "user123",
+                "fund_id": "fund456",
+                "amount": 250000.0,
+                "date": datetime(2024, 2, 1, 12, 0, 0),
+                "_test_mutation": True,
+            },
+            {
+                "transaction_id": "txn888",
+                "user_id": "user123",
+                "fund_id": "fund456",
+                "amount": 250000.0,
+                "type": "subscription",
+                "date": datetime(2024, 2, 1, 12, 0, 0),
+                "_test_mutation": True,
+            },
+        ),
+        "expected": None,
+        "state": [
+            ("subscriptions", {"subscription_id": "sub888"}, True),
+            ("transactions", {"transaction_id": "txn888"}, True),
+        ],
+    },
+    {
+        "name": "commit_cancellation",
+        "method": "commit_cancellation",
+        "args": (
+            {
+                "transaction_id": "txn777",
+                "user_id": "user123",
+                "fund_id": "fund123",
+                "amount": 100000.0,
+                "type": "cancellation",
+                "subscription_id": "sub123",
+                "date": datetime(2024, 3, 1, 12, 0, 0),
+                "_test_mutation": True,
+            },
+            "sub123",
+            "user123",
+            100000.0,
+        ),
+        "expected": None,
+        "state": [
+            ("transactions", {"transaction_id": "txn777"}, True),
+            ("subscriptions", {"subscription_id": "sub123"}, False),
+            ("users", {"_id": "user123", "balance": 600000.0}, True),
+        ],
+    },
+    {
+        "name": "remove_subscription",
+        "method": "remove_subscription",
+        "args": ("sub_tmp",),
+        "setup": (
+            "subscriptions",
+            {
+                "subscription_id": "sub_tmp",
+                "user_id": "user123",
+                "fund_id": "fund456",
+                "_test_mutation": True,
+            },
+        ),
+        "expected": None,
+        "state": [("subscriptions", {"subscription_id": "sub_tmp"}, False)],
+    },
+    {
+        "name": "find_last_subscription",
+        "method": "find_last_subscription",
+        "args": ("user123", "fund123"),
+        "expected": SEED_SUBSCRIPTION,
+    },
+    {
+        "name": "update_user_balance",
+        "method": "update_user_balance",
+        "args": ("user123", -100000.0),
+        "expected": None,
+        "state": [("users", {"_id": "user123", "balance": 400000.0}, True)],
+    },
+    {
+        "name": "get_transactions",
+        "method": "get_transactions",
+        "args": ("user123",),
+        "expected": [{k: v for k, v in SEED_TRANSACTION.items() if k != "_id"}],
+    },
+    {
+        "name": "has_active_subscription",
+        "method": "has_active_subscription",
+        "args": ("user123", "fund123"),
+        "expected": True,
+    },
+]
+
+
+@pytest.fixture(scope="module")
+async def mock_db():
+    """
+    Provides an in-memory mongomock database seeded once per module with
+    the baseline documents, one insert_many per collection. Per-test
+    isolation comes from the rollback fixture below, which is far cheaper
+    than reseeding every table row.
+    """
+    db = AsyncMongoMockClient()["test"]
+    await db.users.insert_many([dict(SEED_USER)])
+    await db.funds.insert_many([dict(fund) for fund in SEED_FUNDS])
+    await db.subscriptions.insert_many([dict(SEED_SUBSCRIPTION)])
+    await db.transactions.insert_many([dict(SEED_TRANSACTION)])
+    return db
+
+
+@pytest.fixture(scope="module")
+def user_repo(mock_db):
+    """
+    Provides a UserRepository wired to the in-memory database.
+    """
+    return UserRepository(db=mock_db)
+
+
+@pytest.fixture(autouse=True)
+async def _rollback(mock_db, user_repo):
+    """
+    Rolls back per-test mutations against the module-scoped database:
+    removes documents marked _test_mutation, restores the seed user (the
+    only seeded document a method mutates in place), and clears the
+    repository's in-process caches.
+    """
+    yield
+    await mock_db.subscriptions.delete_many({"_test_mutation": True})
+    await mock_db.transactions.delete_many({"_test_mutation": True})
+    await mock_db.users.replace_one({"_id": SEED_USER["_id"]}, dict(SEED_USER))
+    await mock_db.subscriptions.replace_one(
+        {"_id": SEED_SUBSCRIPTION["_id"]}, dict(SEED_SUBSCRIPTION), upsert=True
+    )
+    user_repo.invalidate_funds()
+    user_repo._user_cache.clear()  # pylint: disable=W0212
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda c: c["name"])
+async def test_user_repository_crud(mock_db, user_repo, case):
+    """
+    Exercises one repository method per table row against the in-memory
+    database and checks both the returned value and, for mutating methods,
+    the resulting collection state.
+    """
+    if "setup" in case:
+        collection, document = case["setup"]
+        await mock_db[collection].insert_one(dict(document))
+
+    # Copy dict arguments: write methods mutate them (date normalization,
+    # driver-assigned _id) and the table is shared between rows.
+    args = tuple(dict(a) if isinstance(a, dict) else a for a in case["args"])
+
+    result = await getattr(user_repo, case["method"])(*args)
+
+    assert result == case["expected"]
+    for collection, query, should_exist in case.get("state", []):
+        document = await mock_db[collection].find_one(query)
+        assert (document is not None) is should_exist
@@ -0,0 +1,115 @@
+"""
+Tests for the response objects returned by the use-case layer.
+
+Failure and success scenarios are table-driven: one parametrized test per
+class walks every response type, so adding a type costs one table row.
+"""
+
+import pytest
+from starlette import status
+
+from btg.response import ResponseFailure, ResponseSuccess, ResponseTypes
+
+# Status codes bound once at import so the parametrize tables hold plain
+# constants instead of re-resolving starlette attributes per test.
+HTTP_200 = status.HTTP_200_OK
+HTTP_201 = status.HTTP_201_CREATED
+HTTP_400 = status.HTTP_400_BAD_REQUEST
+HTTP_404 = status.HTTP_404_NOT_FOUND
+HTTP_409 = status.HTTP_409_CONFLICT
+HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+FAILURE_CASES = [
+    {
+        "name": "parameters_error",
+        "type": ResponseTypes.PARAMETERS_ERROR,
+        "message": "Invalid parameters",
+        "status_code": HTTP_400,
+        "expected_message": "Invalid parameters",
+    },
+    {
+        "name": "resource_error",
+        "type": ResponseTypes.RESOURCE_ERROR,
+        "message": "User not found",
+        "status_code": HTTP_404,
+        "expected_message": "User not found",
+    },
+    {
+        "name": "conflict_error",
+        "type": ResponseTypes.CONFLICT_ERROR,
+        "message": "Already subscribed",
+        "status_code": HTTP_409,
+        "expected_message": "Already subscribed",
+    },
+    {
+        "name": "system_error_from_exception",
+        "type": ResponseTypes.SYSTEM_ERROR,
+        "message": ValueError("Invalid value"),
+        "status_code": HTTP_500,
+        "expected_message": "ValueError: Invalid value",
+    },
+    {
+        "name": "unknown_type_defaults_to_400",
+        "type": "UnknownError",
+        "message": "Something odd",
+        "status_code": HTTP_400,
+        "expected_message": "Something odd",
+    },
+]
+
+SUCCESS_CASES = [
+    {
+        "name": "default_success",
+        "kwargs": {"value": {"name": "Emmanuel"}},
+        "type": ResponseTypes.SUCCESS,
+        "status_code": HTTP_200,
+        "value": {"name": "Emmanuel"},
+    },
+    {
+        "name": "created",
+        "kwargs": {"response_type": ResponseTypes.CREATED, "value": {"id": "sub123"}},
+        "type": ResponseTypes.CREATED,
+        "status_code": HTTP_201,
+        "value": {"id": "sub123"},
+    },
+    {
+        "name": "empty_value",
+        "kwargs": {},
+        "type": ResponseTypes.SUCCESS,
+        "status_code": HTTP_200,
+        "value": None,
+    },
+]
+
+
+@pytest.mark.parametrize("case", FAILURE_CASES, ids=lambda c: c["name"])
+def test_response_failure(case):
+    """
+    Checks that a ResponseFailure exposes the right type, status code,
+    formatted message, and value dict, and is falsy.
+    """
+    response = ResponseFailure(type_=case["type"], message=case["message"])
+
+    assert response.type == case["type"]
+    assert response.status_code == case["status_code"]
+    assert response.message == case["expected_message"]
+    assert response.value == {
+        "type": case["type"],
+        "message": case["expected_message"],
+        "status_code": case["status_code"],
+    }
+    assert bool(response) is False
+
+
+@pytest.mark.parametrize("case", SUCCESS_CASES, ids=lambda c: c["name"])
+def test_response_success(case):
+    """
+    Checks that a ResponseSuccess exposes the right type, status code, and
+    value, and is truthy.
+    """
+    response = ResponseSuccess(**case["kwargs"])
+
+    assert response.type == case["type"]
+    assert response.status_code == case["status_code"]
+    assert response.value == case["value"]
+    assert bool(response) is True
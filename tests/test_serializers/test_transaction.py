@@ -0,0 +1,108 @@
+"""
+Tests for the Transaction serializer.
+
+Validation goes through `msgspec.convert`, which is how untrusted payloads
+would enter the struct; direct construction is reserved for trusted data.
+The five validation scenarios share one parametrized test: each table row
+derives its payload from the module-level BASE_TXN constant with a
+`{**BASE_TXN, ...}` override and encodes either the expected attributes or
+the expected ValidationError substring.
+"""
+
+from datetime import datetime, timezone
+from typing import List
+
+import msgspec
+import pytest
+
+from btg.serializers.transaction import (
+    BOGOTA,
+    Transaction,
+    json_decoder,
+    json_encoder,
+    to_bogota,
+)
+
+BASE_TXN = {
+    "transaction_id": "txn123",
+    "user_id": "user123",
+    "fund_id": "fund123",
+    "amount": 100.0,
+    "type": "subscription",
+    "date": datetime(2024, 1, 1, 12, 0, 0),
+}
+
+# The localized form of BASE_TXN's naive date, computed once at import so
+# the valid-path rows compare against a constant instead of re-running the
+# astimezone conversion per test.
+EXPECTED_DATE = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc).astimezone(BOGOTA)
+
+# Each case overrides BASE_TXN, optionally wraps the payload in a list, and
+# either expects a clean conversion or a ValidationError matching `match`.
+CASES = [
+    {
+        "name": "valid_data",
+        "overrides": {},
+        "as_list": False,
+        "raises": None,
+        "match": None,
+    },
+    {
+        "name": "invalid_date",
+        "overrides": {"date": "invalid_date_format"},
+        "as_list": False,
+        "raises": msgspec.ValidationError,
+        "match": "Invalid RFC3339",
+    },
+    {
+        "name": "naive_datetime",
+        "overrides": {"date": datetime(2024, 1, 1, 12, 0, 0)},
+        "as_list": False,
+        "raises": None,
+        "match": None,
+    },
+    {
+        "name": "list_valid_data",
+        "overrides": {"transaction_id": "txn456", "type": "cancellation"},
+        "as_list": True,
+        "raises": None,
+        "match": None,
+    },
+    {
+        "name": "list_invalid_data",
+        "overrides": {"amount": "a lot"},
+        "as_list": True,
+        "raises": msgspec.ValidationError,
+        "match": r"\$\[0\]\.amount",
+    },
+]
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda c: c["name"])
+def test_transaction_validation(case):
+    """
+    Converts one payload per table row and checks either the resulting
+    Transaction fields (including the to_bogota normalization used at
+    write time and a JSON round-trip for lists) or the raised error.
+    """
+    data = {**BASE_TXN, **case["overrides"]}
+    payload = [data] if case["as_list"] else data
+    target = List[Transaction] if case["as_list"] else Transaction
+
+    if case["raises"] is not None:
+        with pytest.raises(case["raises"], match=case["match"]):
+            msgspec.convert(payload, type=target)
+        return
+
+    result = msgspec.convert(payload, type=target)
+    transaction = result[0] if case["as_list"] else result
+
+    assert transaction.transaction_id == data["transaction_id"]
+    assert transaction.user_id == data["user_id"]
+    assert transaction.fund_id == data["fund_id"]
+    assert transaction.amount == data["amount"]
+    assert transaction.type == data["type"]
+    assert transaction.date == data["date"]
+    assert to_bogota(transaction.date) == EXPECTED_DATE
+    if case["as_list"]:
+        assert json_decoder.decode(json_encoder.encode(result)) == result